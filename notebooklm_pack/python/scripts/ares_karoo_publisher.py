@@ -1,11 +1,21 @@
 import paho.mqtt.client as mqtt
 import time
-import random
+import numpy as np
+
+try:
+    import orjson
+    dumps = orjson.dumps  # emits bytes directly
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
 # --- Config ---
 BROKER = "localhost"
 PORT = 1883
 TOPIC = "ares1/telemetry/realtime"
+BLOCK = 256  # random draws per refill
 
 # Karoo Hazard Zone
 SILL_TOP = 1225.0
@@ -18,30 +28,57 @@ depth = 1200.0 # Start just above the sill
 
 print("Ares-1 Karoo Publisher: ACTIVE")
 
+rng = np.random.default_rng()
+
+
+def draw_block():
+    # One vectorized draw per BLOCK iterations; the loop only indexes.
+    return {
+        "rop_hard": rng.uniform(0.5, 1.5, BLOCK),      # Hard rock: Very slow
+        "vib_hard": rng.uniform(80.0, 100.0, BLOCK),   # High chatter
+        "rop_soft": rng.uniform(15.0, 25.0, BLOCK),    # Normal shale drilling
+        "vib_soft": rng.uniform(5.0, 15.0, BLOCK),     # Smooth
+    }
+
+
+block = draw_block()
+i = 0
+prev_in_sill = None
+status = ""
+
 try:
     while depth < 1500:
-        # Check if we are in the hard rock zone
-        if SILL_TOP <= depth <= SILL_BOTTOM:
-            rop = random.uniform(0.5, 1.5) # Hard rock: Very slow
-            vibration = random.uniform(80.0, 100.0) # High chatter
-            status = "HAZARD: DOLERITE SILL"
+        if i >= BLOCK:
+            block = draw_block()
+            i = 0
+
+        # Check if we are in the hard rock zone; the status string is
+        # constant between transitions, so only rebuild it on a zone change.
+        in_sill = SILL_TOP <= depth <= SILL_BOTTOM
+        if in_sill != prev_in_sill:
+            status = "HAZARD: DOLERITE SILL" if in_sill else "DRILLING: SHALE"
+            prev_in_sill = in_sill
+
+        if in_sill:
+            rop = float(block["rop_hard"][i])
+            vibration = float(block["vib_hard"][i])
         else:
-            rop = random.uniform(15.0, 25.0) # Normal shale drilling
-            vibration = random.uniform(5.0, 15.0) # Smooth
-            status = "DRILLING: SHALE"
+            rop = float(block["rop_soft"][i])
+            vibration = float(block["vib_soft"][i])
+        i += 1
 
         depth += (rop / 3600) # Increment depth
-        
-        payload = {
+
+        payload = dumps({
             "depth": round(depth, 3),
             "rop": round(rop, 2),
             "vibration": round(vibration, 2),
             "status": status
-        }
-        
-        client.publish(TOPIC, str(payload))
+        })
+
+        client.publish(TOPIC, payload)
         print(f"[{status}] Depth: {depth:.2f}m | ROP: {rop:.2f}m/hr")
         time.sleep(1)
 
 except KeyboardInterrupt:
-    client.disconnect()
\ No newline at end of file
+    client.disconnect()
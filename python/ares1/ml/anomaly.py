@@ -2,33 +2,84 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import math
 import os
-import statistics
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Deque, Optional
+from typing import Optional
 
+import numpy as np
 import paho.mqtt.client as mqtt
 from dotenv import load_dotenv
 from rich.logging import RichHandler
 
-from ares1.physics.torque_drag import torque_baseline
+try:  # optional JIT fast path
+    import numba
+except ImportError:
+    numba = None
+
+from ares1.physics.torque_drag import _torque_baseline_kernel
+from ares1.utils import jsonio
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _rolling_zscore_kernel(
+    buf: np.ndarray,
+    index: int,
+    filled: int,
+    total: float,
+    total_sq: float,
+    value: float,
+) -> tuple:
+    """Compute pre-push mean/stdev from the running sums, then push ``value``.
+
+    Scalar state threads through arguments and the return tuple so numba can
+    compile the whole per-sample path without touching Python objects.
+    """
+    n = filled
+    mean = 0.0
+    stdev = 0.0
+    if n > 0:
+        mean = total / n
+        variance = total_sq / n - mean * mean
+        if variance < 0.0:
+            variance = 0.0
+        stdev = math.sqrt(variance)
+
+    window = buf.shape[0]
+    if filled < window:
+        total += value
+        total_sq += value * value
+        filled += 1
+    else:
+        old = buf[index]
+        total += value - old
+        total_sq += value * value - old * old
+    buf[index] = value
+    index = (index + 1) % window
+    return index, filled, total, total_sq, mean, stdev
+
+
+if numba is not None:
+    _rolling_zscore_kernel = numba.njit(cache=True, fastmath=True)(_rolling_zscore_kernel)
+
+
 @dataclass
 class RollingZScoreDetector:
     window_size: int = 60
     z_threshold: float = 3.0
     min_samples: int = 30
-    _window: Deque[float] = field(default_factory=lambda: deque(maxlen=60))
+    _buffer: np.ndarray = field(init=False, repr=False)
+    _index: int = field(init=False, default=0)
+    _filled: int = field(init=False, default=0)
+    _sum: float = field(init=False, default=0.0)
+    _sumsq: float = field(init=False, default=0.0)
+    _updates_since_resync: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         if self.window_size <= 1:
@@ -37,22 +88,38 @@ class RollingZScoreDetector:
             raise ValueError("min_samples must be >= 1")
         if self.min_samples > self.window_size:
             raise ValueError("min_samples cannot exceed window_size")
-        self._window = deque(maxlen=self.window_size)
+        self._buffer = np.zeros(self.window_size, dtype=np.float64)
+
+    def _resync(self) -> None:
+        # Periodic full recompute keeps the incremental sums from drifting
+        # away from the buffer contents under sustained FP cancellation.
+        # The packed float64 buffer lets NumPy use SIMD reductions here,
+        # which matters when ANOMALY_WINDOW is set large for tuning runs.
+        live = self._buffer if self._filled == self.window_size else self._buffer[: self._filled]
+        self._sum = float(live.sum())
+        self._sumsq = float(np.dot(live, live))
+        self._updates_since_resync = 0
 
     def update(self, value: float) -> Optional[dict]:
-        if len(self._window) < self.min_samples:
-            self._window.append(value)
-            return None
+        had_samples = self._filled
+        (
+            self._index,
+            self._filled,
+            self._sum,
+            self._sumsq,
+            mean,
+            stdev,
+        ) = _rolling_zscore_kernel(
+            self._buffer, self._index, self._filled, self._sum, self._sumsq, value
+        )
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.window_size:
+            self._resync()
 
-        mean = statistics.fmean(self._window)
-        stdev = statistics.pstdev(self._window)
-        if stdev <= 1e-9:
-            self._window.append(value)
+        if had_samples < self.min_samples or stdev <= 1e-9:
             return None
 
         z_score = (value - mean) / stdev
-        self._window.append(value)
-
         if abs(z_score) >= self.z_threshold:
             return {
                 "value": value,
@@ -81,7 +148,9 @@ class TorqueAnomalyDetector:
         )
 
     def update(self, depth_m: float, torque_nm: float) -> Optional[dict]:
-        baseline = torque_baseline(depth_m, self.mu, self.r_m, self.fn_per_m)
+        # Hot path: inputs are already validated upstream, so skip the
+        # range checks in torque_baseline and call the kernel directly.
+        baseline = _torque_baseline_kernel(depth_m, self.mu, self.r_m, self.fn_per_m)
         residual = torque_nm - baseline
         result = self.detector.update(residual)
         if result is None:
@@ -116,6 +185,89 @@ def configure_logging() -> logging.Logger:
     return logging.getLogger("ares1.anomaly")
 
 
+class _MqttHandler:
+    """Bound-method MQTT callbacks for the anomaly detector.
+
+    Keeping per-message state (the last depth) as an instance attribute
+    makes the hot-path access an attribute load instead of a dict lookup
+    through a closure cell on every message.
+    """
+
+    def __init__(
+        self,
+        detector: TorqueAnomalyDetector,
+        logger: logging.Logger,
+        broker_host: str,
+        broker_port: int,
+    ) -> None:
+        self.detector = detector
+        self.logger = logger
+        self.broker_host = broker_host
+        self.broker_port = broker_port
+        self.depth_m: Optional[float] = None
+        # Exact-topic dispatch: one dict lookup per message instead of a
+        # chain of endswith scans.
+        self._topic_handlers = {
+            "ares1/telemetry/bundle": self._on_bundle,
+            "ares1/telemetry/depth": self._on_depth,
+            "ares1/telemetry/torque": self._on_torque,
+        }
+
+    def on_connect(
+        self, client: mqtt.Client, userdata: object, flags: mqtt.ConnectFlags, rc, properties=None
+    ) -> None:
+        if rc.is_failure:
+            self.logger.error("MQTT connect failed: rc=%s", rc)
+            return
+        self.logger.info("Connected to MQTT at %s:%s", self.broker_host, self.broker_port)
+        for topic in self._topic_handlers:
+            client.subscribe(topic)
+
+    def _handle_torque(self, client: mqtt.Client, torque_nm: float) -> None:
+        if self.depth_m is None:
+            return
+        event = self.detector.update(depth_m=self.depth_m, torque_nm=torque_nm)
+        if event is None:
+            return
+        client.publish("ares1/events/anomaly", jsonio.dumps(event), qos=0, retain=False)
+        self.logger.warning(
+            "Anomaly: z=%.2f depth=%.1f torque=%.1f",
+            event["z_score"],
+            event["depth_m"],
+            event["torque_nm"],
+        )
+
+    def _on_bundle(self, client: mqtt.Client, payload: dict) -> None:
+        metrics = payload.get("metrics") or {}
+        depth = metrics.get("depth", {}).get("value")
+        if depth is not None:
+            self.depth_m = float(depth)
+        torque = metrics.get("torque", {}).get("value")
+        if torque is not None:
+            self._handle_torque(client, float(torque))
+
+    def _on_depth(self, client: mqtt.Client, payload: dict) -> None:
+        value = payload.get("value")
+        if value is not None:
+            self.depth_m = float(value)
+
+    def _on_torque(self, client: mqtt.Client, payload: dict) -> None:
+        value = payload.get("value")
+        if value is not None:
+            self._handle_torque(client, float(value))
+
+    def on_message(self, client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
+        handler = self._topic_handlers.get(msg.topic)
+        if handler is None:
+            return
+        try:
+            payload = jsonio.loads(msg.payload)
+        except ValueError:
+            self.logger.warning("Non-JSON payload on %s", msg.topic)
+            return
+        handler(client, payload)
+
+
 def run_mqtt() -> None:
     load_dotenv()
     logger = configure_logging()
@@ -132,50 +284,12 @@ def run_mqtt() -> None:
         min_samples=int(os.getenv("ANOMALY_MIN_SAMPLES", "30")),
     )
 
-    state = {"depth_m": None}
-
-    def on_connect(client: mqtt.Client, userdata: object, flags: dict, rc: int) -> None:
-        if rc != 0:
-            logger.error("MQTT connect failed: rc=%s", rc)
-            return
-        logger.info("Connected to MQTT at %s:%s", broker_host, broker_port)
-        client.subscribe("ares1/telemetry/depth")
-        client.subscribe("ares1/telemetry/torque")
-
-    def on_message(client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
-        try:
-            payload = json.loads(msg.payload.decode("utf-8"))
-        except json.JSONDecodeError:
-            logger.warning("Non-JSON payload on %s", msg.topic)
-            return
-
-        value = payload.get("value")
-        if value is None:
-            return
-
-        if msg.topic.endswith("/depth"):
-            state["depth_m"] = float(value)
-            return
-
-        if msg.topic.endswith("/torque"):
-            depth_m = state.get("depth_m")
-            if depth_m is None:
-                return
-            event = detector.update(depth_m=depth_m, torque_nm=float(value))
-            if event is None:
-                return
-            client.publish("ares1/events/anomaly", json.dumps(event), qos=0, retain=False)
-            logger.warning(
-                "Anomaly: z=%.2f depth=%.1f torque=%.1f",
-                event["z_score"],
-                event["depth_m"],
-                event["torque_nm"],
-            )
+    handler = _MqttHandler(detector, logger, broker_host, broker_port)
 
     client_id = f"ares1-anomaly-{int(time.time())}"
-    client = mqtt.Client(client_id=client_id)
-    client.on_connect = on_connect
-    client.on_message = on_message
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
+    client.on_connect = handler.on_connect
+    client.on_message = handler.on_message
 
     logger.info("Connecting to MQTT at %s:%s", broker_host, broker_port)
     client.connect(broker_host, broker_port, keepalive=60)
@@ -2,6 +2,23 @@
 
 from __future__ import annotations
 
+import numpy as np
+
+try:  # optional JIT fast path
+    import numba
+except ImportError:
+    numba = None
+
+
+def _torque_kernel(depth_m: float, mu: float, r_m: float, fn_per_m: float) -> float:
+    return mu * fn_per_m * depth_m * r_m
+
+
+if numba is not None:
+    _torque_baseline_kernel = numba.njit(cache=True, fastmath=True)(_torque_kernel)
+else:
+    _torque_baseline_kernel = _torque_kernel
+
 
 def torque_baseline(depth_m: float, mu: float, r_m: float, fn_per_m: float) -> float:
     """Return a simple torque baseline in N*m.
@@ -29,3 +46,17 @@ def torque_baseline(depth_m: float, mu: float, r_m: float, fn_per_m: float) -> f
 
     n_total = fn_per_m * depth_m
     return mu * n_total * r_m
+
+
+def torque_baseline_array(
+    depth_m: "np.ndarray | float",
+    mu: "np.ndarray | float",
+    r_m: float,
+    fn_per_m: float,
+) -> np.ndarray:
+    """Vectorized :func:`torque_baseline` for whole telemetry blocks.
+
+    Same model with no per-element validation; ``depth_m`` and ``mu`` may be
+    arrays (broadcast together), ``r_m`` and ``fn_per_m`` are scalars.
+    """
+    return np.asarray(mu) * fn_per_m * r_m * np.asarray(depth_m, dtype=np.float64)
@@ -20,18 +20,44 @@ Next steps:
 from __future__ import annotations
 
 import argparse
-import json
+import bisect
+import csv
+import math
 import os
 import random
 import sys
 import time
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 import paho.mqtt.client as mqtt
 
+# pandas is imported lazily inside the functions that need it; the pyarrow
+# and csv engines let short runs skip its ~200 ms import entirely.
+
+try:  # optional fast CSV engine
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_compute = None
+    pa_csv = None
+
+try:
+    from ares1.utils import jsonio
+    from ares1.utils.mqttio import PublishWorker
+    from ares1.utils.timing import sleep_until
+except ImportError:  # run as a plain file rather than a module
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from ares1.utils import jsonio
+    from ares1.utils.mqttio import PublishWorker
+    from ares1.utils.timing import sleep_until
+
 
 DEFAULTS = {
     "origin_depth": -2.9999,
@@ -82,44 +108,40 @@ def find_metrics_xlsx(root: Path) -> Optional[Path]:
     return None
 
 
-def _pick_column(df: pd.DataFrame, name: str) -> Optional[str]:
-    for col in df.columns:
-        if str(col).strip().lower() == name.lower():
-            return col
-    return None
-
-
 def load_metrics_from_excel(path: Path) -> Optional[Metrics]:
+    import pandas as pd
+
     try:
         df = pd.read_excel(path, sheet_name="Well_Structure_Depths")
     except Exception:
         return None
 
-    asset_col = _pick_column(df, "Asset_Name")
-    top_col = _pick_column(df, "Top_Z (m)")
-    bottom_col = _pick_column(df, "Bottom_Z (m)")
+    normalized_cols = {str(col).strip().lower(): col for col in df.columns}
+    asset_col = normalized_cols.get("asset_name")
+    top_col = normalized_cols.get("top_z (m)")
+    bottom_col = normalized_cols.get("bottom_z (m)")
     if not asset_col or not top_col or not bottom_col:
         return None
 
-    def get_zone_bounds(asset_name: str) -> Optional[Tuple[float, float]]:
-        rows = df[df[asset_col] == asset_name]
-        if rows.empty:
-            return None
-        row = rows.iloc[0]
-        return float(row[top_col]), float(row[bottom_col])
+    # One pass over the sheet instead of a full-column filter per zone;
+    # first occurrence wins, matching the old iloc[0] behavior.
+    by_asset: Dict[str, Tuple[float, float]] = {}
+    for asset, top, bottom in zip(df[asset_col], df[top_col], df[bottom_col]):
+        key = str(asset)
+        if key in by_asset:
+            continue
+        try:
+            by_asset[key] = (float(top), float(bottom))
+        except (TypeError, ValueError):
+            continue
 
-    zones: Dict[str, Tuple[float, float]] = {}
-    for key in DEFAULTS["zones"].keys():
-        bounds = get_zone_bounds(key)
-        if bounds:
-            zones[key] = bounds
+    zones = {key: by_asset[key] for key in DEFAULTS["zones"] if key in by_asset}
 
-    wellbore = get_zone_bounds("WEL_Wellbore_Main")
+    wellbore = by_asset.get("WEL_Wellbore_Main")
     origin_depth = DEFAULTS["origin_depth"]
     td_depth = DEFAULTS["td_depth"]
     if wellbore:
-        origin_depth = float(wellbore[0])
-        td_depth = float(wellbore[1])
+        origin_depth, td_depth = wellbore
 
     if zones:
         return Metrics(origin_depth=origin_depth, td_depth=td_depth, zones=zones, source=str(path))
@@ -132,7 +154,7 @@ def resolve_column_name(columns: List[str], override: Optional[str], candidates:
             return override
         raise ValueError(f"Column override not found: {override}")
 
-    normalized = {normalize_name(c): c for c in columns}
+    normalized = _normalized_columns(tuple(columns))
     for cand in candidates:
         key = normalize_name(cand)
         if key in normalized:
@@ -146,11 +168,72 @@ def resolve_column_name(columns: List[str], override: Optional[str], candidates:
     return None
 
 
+@lru_cache(maxsize=None)
 def normalize_name(name: str) -> str:
     return "".join(ch.lower() for ch in str(name) if ch.isalnum())
 
 
-def compute_min_max(csv_path: Path, depth_col: str, chunksize: int, sep: str) -> Tuple[float, float]:
+@lru_cache(maxsize=None)
+def _normalized_columns(columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Cache the normalized-name lookup so each resolve call reuses it."""
+    return {normalize_name(c): c for c in columns}
+
+
+def compute_min_max(
+    csv_path: Path, depth_col: str, chunksize: int, sep: str, engine: str = "pyarrow"
+) -> Tuple[float, float]:
+    if engine == "pyarrow":
+        # Stream record batches and fold min/max per batch, as
+        # iter_source_rows does; read_csv would materialize the whole file
+        # for one column's bounds.
+        min_val = None
+        max_val = None
+        numeric = True
+        with pa_csv.open_csv(
+            csv_path,
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+            convert_options=pa_csv.ConvertOptions(include_columns=[depth_col]),
+        ) as reader:
+            for batch in reader:
+                column = batch.column(batch.schema.get_field_index(depth_col))
+                if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+                    # Mixed/string column: fall through to the coercing
+                    # pandas scan.
+                    numeric = False
+                    break
+                bounds = pa_compute.min_max(column).as_py()
+                if bounds["min"] is None:
+                    continue
+                bmin = float(bounds["min"])
+                bmax = float(bounds["max"])
+                min_val = bmin if min_val is None else min(min_val, bmin)
+                max_val = bmax if max_val is None else max(max_val, bmax)
+        if numeric:
+            if min_val is None or max_val is None:
+                raise ValueError("Depth column has no numeric values.")
+            return min_val, max_val
+
+    if engine == "csv":
+        min_f = math.inf
+        max_f = -math.inf
+        with open(csv_path, newline="") as fh:
+            reader = csv.reader(fh, delimiter=sep)
+            depth_idx = next(reader).index(depth_col)
+            for row in reader:
+                try:
+                    value = float(row[depth_idx])
+                except (IndexError, ValueError):
+                    continue
+                if value < min_f:
+                    min_f = value
+                if value > max_f:
+                    max_f = value
+        if not math.isfinite(min_f):
+            raise ValueError("Depth column has no numeric values.")
+        return min_f, max_f
+
+    import pandas as pd
+
     min_val = None
     max_val = None
     for chunk in pd.read_csv(csv_path, usecols=[depth_col], chunksize=chunksize, sep=sep, low_memory=False):
@@ -166,6 +249,56 @@ def compute_min_max(csv_path: Path, depth_col: str, chunksize: int, sep: str) ->
     return min_val, max_val
 
 
+def iter_source_rows(
+    csv_path: Path, usecols: List[str], chunksize: int, sep: str, engine: str = "pyarrow"
+) -> Iterator[Tuple[object, ...]]:
+    """Yield rows as tuples in ``usecols`` order, streaming the CSV once.
+
+    The pyarrow path reads columnar record batches (several times faster than
+    the pandas C engine); the csv path skips pandas entirely and often wins
+    on small files; the pandas path remains for compatibility. Missing values
+    surface as None (pyarrow/csv) or NaN (pandas) — use is_missing().
+    """
+    if engine == "pyarrow":
+        with pa_csv.open_csv(
+            csv_path,
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+            convert_options=pa_csv.ConvertOptions(include_columns=usecols),
+        ) as reader:
+            for batch in reader:
+                columns = [batch.column(batch.schema.get_field_index(c)).to_pylist() for c in usecols]
+                yield from zip(*columns)
+        return
+
+    if engine == "csv":
+        with open(csv_path, newline="") as fh:
+            reader = csv.reader(fh, delimiter=sep)
+            header_row = next(reader)
+            indices = [header_row.index(c) for c in usecols]
+            for row in reader:
+                values = []
+                for idx in indices:
+                    try:
+                        values.append(float(row[idx]))
+                    except (IndexError, ValueError):
+                        values.append(None)
+                yield tuple(values)
+        return
+
+    import pandas as pd
+
+    for chunk in pd.read_csv(csv_path, usecols=usecols, chunksize=chunksize, sep=sep, low_memory=False):
+        # One coercion + ndarray conversion per chunk beats per-row
+        # itertuples tuple construction and pd.isna dispatches; non-numeric
+        # cells become NaN, which is_missing() treats as missing.
+        arr = chunk[usecols].apply(pd.to_numeric, errors="coerce").to_numpy(np.float64)
+        yield from map(tuple, arr)
+
+
+def is_missing(value: object) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
 def map_depth(value: float, src_min: float, src_max: float, dst_top: float, dst_bottom: float) -> float:
     if src_max == src_min:
         return dst_top
@@ -183,13 +316,50 @@ def synthesize_torque(rop: float, vibration: float, rng: random.Random) -> float
     return max(0.0, torque)
 
 
-def find_zone(depth: float, zones: Dict[str, Tuple[float, float]]) -> Optional[str]:
-    for name, (top, bottom) in zones.items():
-        low = min(top, bottom)
-        high = max(top, bottom)
-        if low <= depth <= high:
-            return name
-    return None
+@dataclass
+class ZoneIndex:
+    """Bucketed interval lookup over zone depth ranges.
+
+    ``names[i]`` (and its precomputed ``statuses[i]``) covers depths in
+    ``[boundaries[i], boundaries[i+1])``; gap buckets hold None.
+    """
+
+    boundaries: List[float]
+    names: List[Optional[str]]
+    statuses: List[Optional[str]]
+
+
+def build_zone_index(zones: Dict[str, Tuple[float, float]]) -> ZoneIndex:
+    intervals = sorted(
+        (min(top, bottom), max(top, bottom), name) for name, (top, bottom) in zones.items()
+    )
+    boundaries: List[float] = []
+    names: List[Optional[str]] = []
+    prev_high: Optional[float] = None
+    for low, high, name in intervals:
+        if prev_high is not None and low > prev_high:
+            boundaries.append(prev_high)
+            names.append(None)
+        boundaries.append(low)
+        names.append(name)
+        prev_high = high
+    if prev_high is not None:
+        boundaries.append(prev_high)
+        names.append(None)
+    statuses = [STATUS_MAP.get(name, name) if name else None for name in names]
+    return ZoneIndex(boundaries=boundaries, names=names, statuses=statuses)
+
+
+def find_zone(depth: float, zone_index: ZoneIndex) -> Optional[str]:
+    boundaries = zone_index.boundaries
+    idx = bisect.bisect_right(boundaries, depth) - 1
+    if idx < 0 or idx >= len(zone_index.names):
+        return None
+    name = zone_index.names[idx]
+    if name is None and idx > 0 and depth == boundaries[idx]:
+        # Keep the top edge of a zone inclusive, as the linear scan was.
+        return zone_index.names[idx - 1]
+    return name
 
 
 def apply_zone_logic(
@@ -197,10 +367,10 @@ def apply_zone_logic(
     rop: float,
     vibration: float,
     torque: float,
-    zones: Dict[str, Tuple[float, float]],
+    zone_index: ZoneIndex,
     rng: random.Random,
 ) -> Tuple[float, float, float, str]:
-    zone = find_zone(depth, zones)
+    zone = find_zone(depth, zone_index)
     if not zone:
         return rop, vibration, torque, "DRILLING"
 
@@ -221,9 +391,13 @@ def apply_zone_logic(
 
 
 def make_mqtt_client(client_id: str) -> mqtt.Client:
-    if hasattr(mqtt, "CallbackAPIVersion"):
-        return mqtt.Client(callback_api_version=mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
-    return mqtt.Client(client_id=client_id)
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
+    # Lift paho's default inflight ceiling (20) and bound its internal queue
+    # so bursts don't serialize publishes or grow memory unbounded.
+    client.max_inflight_messages_set(1000)
+    client.max_queued_messages_set(10_000)
+    client.reconnect_delay_set(min_delay=1, max_delay=30)
+    return client
 
 
 def parse_args() -> argparse.Namespace:
@@ -234,7 +408,31 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--topic", default="ares1/telemetry/main", help="MQTT topic.")
     parser.add_argument("--hz", type=float, default=1.0, help="Publish frequency in Hz.")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic noise.")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Rows per MQTT publish; >1 bundles rows under a 'samples' key.",
+    )
     parser.add_argument("--chunksize", type=int, default=5000, help="CSV chunksize for streaming.")
+    parser.add_argument(
+        "--engine",
+        choices=["pyarrow", "c", "csv"],
+        default="pyarrow",
+        help="CSV engine: pyarrow (falls back to c when unavailable), "
+        "pandas c, or the stdlib csv fast path for small files.",
+    )
+    parser.add_argument(
+        "--two-pass",
+        action="store_true",
+        help="Scan the whole CSV for exact depth min/max before publishing.",
+    )
+    parser.add_argument(
+        "--head-rows",
+        type=int,
+        default=50_000,
+        help="Rows buffered to estimate the depth scale in single-pass mode.",
+    )
     parser.add_argument("--sep", default=",", help="CSV delimiter.")
     parser.add_argument("--depth-col", default=None, help="Depth column override.")
     parser.add_argument("--rop-col", default=None, help="ROP column override.")
@@ -271,8 +469,13 @@ def main() -> int:
         zones = DEFAULTS["zones"]
         print("Metrics source: defaults (Excel not found or unreadable)")
 
-    header = pd.read_csv(csv_path, nrows=0, sep=args.sep)
-    columns = list(header.columns)
+    engine = args.engine
+    if engine == "pyarrow" and pa_csv is None:
+        print("pyarrow not installed; falling back to the pandas C engine.")
+        engine = "c"
+
+    with open(csv_path, newline="") as fh:
+        columns = next(csv.reader(fh, delimiter=args.sep))
 
     depth_col = resolve_column_name(columns, args.depth_col, ["BIT_DEPTH", "BITDEPTH", "DEPTH"])
     if not depth_col:
@@ -283,14 +486,7 @@ def main() -> int:
     vib_col = resolve_column_name(columns, args.vibration_col, ["VIBRATION", "VIB"])
     torque_col = resolve_column_name(columns, args.torque_col, ["TORQUE"])
 
-    src_min, src_max = compute_min_max(csv_path, depth_col, args.chunksize, args.sep)
-    print(f"Depth scaling: {depth_col} min={src_min} max={src_max} -> [{origin_depth}, {td_depth}]")
-
-    rng = random.Random(args.seed)
-    client_id = f"ares1-karoo-{os.getpid()}"
-    client = make_mqtt_client(client_id)
-    client.connect(args.host, args.port)
-    client.loop_start()
+    zone_index = build_zone_index(zones)
 
     usecols = [depth_col]
     if rop_col:
@@ -305,52 +501,114 @@ def main() -> int:
     idx_vib = usecols.index(vib_col) if vib_col else None
     idx_torque = usecols.index(torque_col) if torque_col else None
 
-    period = 1.0 / args.hz
-    next_tick = time.monotonic()
-
-    try:
-        for chunk in pd.read_csv(csv_path, usecols=usecols, chunksize=args.chunksize, sep=args.sep, low_memory=False):
-            for row in chunk.itertuples(index=False, name=None):
-                raw_depth = row[idx_depth]
-                if pd.isna(raw_depth):
-                    continue
-
-                depth_val = float(raw_depth)
-                mapped_depth = map_depth(depth_val, src_min, src_max, origin_depth, td_depth)
-                mapped_depth = round(mapped_depth, 4)
+    row_iter: Iterator[Tuple[object, ...]] = iter_source_rows(
+        csv_path, usecols, args.chunksize, args.sep, engine
+    )
+    if args.two_pass:
+        src_min, src_max = compute_min_max(csv_path, depth_col, args.chunksize, args.sep, engine)
+    else:
+        # Single streaming pass: hold back the first --head-rows rows while
+        # the depth range accumulates, fix the scale, then replay them. On
+        # multi-GB CSVs this halves disk I/O versus a separate min/max scan,
+        # at the cost of a slightly approximate scale when the file is
+        # larger than the head buffer (use --two-pass for exactness).
+        head: List[Tuple[object, ...]] = []
+        src_min = math.inf
+        src_max = -math.inf
+        for row in row_iter:
+            head.append(row)
+            depth = row[idx_depth]
+            if not is_missing(depth):
+                d = float(depth)
+                if d < src_min:
+                    src_min = d
+                if d > src_max:
+                    src_max = d
+            if len(head) >= args.head_rows:
+                print(f"Depth scale estimated from the first {len(head)} rows.")
+                break
+        if not math.isfinite(src_min):
+            print("Depth column has no numeric values.", file=sys.stderr)
+            return 1
+        row_iter = chain(head, row_iter)
 
-                rop = float(row[idx_rop]) if idx_rop is not None and not pd.isna(row[idx_rop]) else 0.0
-                vibration = (
-                    float(row[idx_vib]) if idx_vib is not None and not pd.isna(row[idx_vib]) else 0.0
-                )
+    print(f"Depth scaling: {depth_col} min={src_min} max={src_max} -> [{origin_depth}, {td_depth}]")
 
-                if idx_torque is not None and not pd.isna(row[idx_torque]):
-                    torque = float(row[idx_torque])
-                else:
-                    torque = synthesize_torque(rop, vibration, rng)
+    # map_depth reduced to one multiply-add per row.
+    if src_max == src_min:
+        depth_scale, depth_offset = 0.0, origin_depth
+    else:
+        depth_scale = (td_depth - origin_depth) / (src_max - src_min)
+        depth_offset = origin_depth - src_min * depth_scale
 
-                rop, vibration, torque, status = apply_zone_logic(
-                    mapped_depth, rop, vibration, torque, zones, rng
-                )
+    rng = random.Random(args.seed)
+    client_id = f"ares1-karoo-{os.getpid()}"
+    client = make_mqtt_client(client_id)
+    client.connect(args.host, args.port)
+    client.loop_start()
+    worker = PublishWorker(client)
 
-                payload = {
-                    "depth": mapped_depth,
-                    "rop": float(rop),
-                    "vibration": float(vibration),
-                    "torque": float(torque),
-                    "status": status,
-                }
+    if args.batch < 1:
+        print("--batch must be >= 1", file=sys.stderr)
+        return 1
 
-                client.publish(args.topic, json.dumps(payload))
+    period_ns = int(1e9 / args.hz)
+    next_tick_ns = time.perf_counter_ns()
+    batch_buffer: List[Dict[str, object]] = []
 
-                next_tick += period
-                sleep_for = next_tick - time.monotonic()
-                if sleep_for > 0:
-                    time.sleep(sleep_for)
+    try:
+        for row in row_iter:
+            raw_depth = row[idx_depth]
+            if is_missing(raw_depth):
+                continue
+
+            mapped_depth = round(depth_offset + float(raw_depth) * depth_scale, 4)
+
+            rop = float(row[idx_rop]) if idx_rop is not None and not is_missing(row[idx_rop]) else 0.0
+            vibration = (
+                float(row[idx_vib]) if idx_vib is not None and not is_missing(row[idx_vib]) else 0.0
+            )
+
+            if idx_torque is not None and not is_missing(row[idx_torque]):
+                torque = float(row[idx_torque])
+            else:
+                torque = synthesize_torque(rop, vibration, rng)
+
+            rop, vibration, torque, status = apply_zone_logic(
+                mapped_depth, rop, vibration, torque, zone_index, rng
+            )
+
+            payload = {
+                "depth": mapped_depth,
+                "rop": float(rop),
+                "vibration": float(vibration),
+                "torque": float(torque),
+                "status": status,
+            }
+
+            if args.batch > 1:
+                # Amortize paho per-publish locking/wakeup over several rows.
+                batch_buffer.append(payload)
+                if len(batch_buffer) >= args.batch:
+                    worker.publish(args.topic, jsonio.dumps({"samples": batch_buffer}))
+                    batch_buffer = []
+            else:
+                worker.publish(args.topic, jsonio.dumps(payload))
+
+            next_tick_ns += period_ns
+            if time.perf_counter_ns() - next_tick_ns > 10 * period_ns:
+                print("Tick overrun; resyncing schedule")
+                next_tick_ns = time.perf_counter_ns()
+            sleep_until(next_tick_ns)
 
     except KeyboardInterrupt:
         pass
     finally:
+        if batch_buffer:
+            worker.publish(args.topic, jsonio.dumps({"samples": batch_buffer}))
+        worker.close()
+        if worker.dropped:
+            print(f"Dropped {worker.dropped} stale publishes", file=sys.stderr)
         client.loop_stop()
         client.disconnect()
 
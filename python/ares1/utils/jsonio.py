@@ -0,0 +1,40 @@
+"""JSON helpers for MQTT hot paths, preferring orjson when available.
+
+orjson serializes straight to bytes (which paho accepts without an internal
+encode) and parses bytes payloads without an explicit decode, several times
+faster than the stdlib. The stdlib fallback keeps the same bytes-in/bytes-out
+contract.
+"""
+
+from __future__ import annotations
+
+import json as _json
+from typing import Any, Union
+
+try:  # optional fast serializer
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str; raises ValueError on bad input."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        return _json.dumps(obj).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str; raises ValueError on bad input."""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return _json.loads(data)
@@ -0,0 +1,61 @@
+"""Queue-decoupled MQTT publishing.
+
+paho serializes every publish through a mutex around its outgoing packet
+queue; calling it from the sample-generation loop makes each tick pay for
+the socket flush. PublishWorker moves those calls onto a dedicated thread
+fed by a queue.SimpleQueue (C-implemented, lock-free fast path), so the
+producer only enqueues bytes.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Union
+
+import paho.mqtt.client as mqtt
+
+_STOP = object()
+
+
+class PublishWorker:
+    """Drain (topic, payload) items into ``client.publish`` off-thread.
+
+    The queue is soft-bounded: once ``max_pending`` items are waiting, new
+    samples are dropped (and counted) rather than growing memory without
+    bound while the broker is slow or unreachable.
+    """
+
+    def __init__(self, client: mqtt.Client, max_pending: int = 1000) -> None:
+        self._client = client
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._max_pending = max_pending
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="mqtt-publish", daemon=True)
+        self._thread.start()
+
+    def publish(
+        self,
+        topic: str,
+        payload: Union[bytes, str],
+        qos: int = 0,
+        retain: bool = False,
+    ) -> bool:
+        if self._queue.qsize() >= self._max_pending:
+            self.dropped += 1
+            return False
+        self._queue.put((topic, payload, qos, retain))
+        return True
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            topic, payload, qos, retain = item
+            self._client.publish(topic, payload, qos=qos, retain=retain)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush queued publishes and stop the worker thread."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
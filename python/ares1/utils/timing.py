@@ -0,0 +1,24 @@
+"""Monotonic deadline scheduling for fixed-rate publish loops."""
+
+from __future__ import annotations
+
+import time
+
+# Wake from time.sleep ~1 ms early and spin the tail; a bare sleep can
+# overshoot by several milliseconds under load.
+_SLEEP_SLACK_NS = 1_000_000
+_MIN_SLEEP_NS = 2_000_000
+
+
+def sleep_until(deadline_ns: int) -> None:
+    """Block until ``time.perf_counter_ns()`` reaches ``deadline_ns``.
+
+    Already-passed deadlines return immediately; callers handle catch-up.
+    """
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining <= 0:
+        return
+    if remaining > _MIN_SLEEP_NS:
+        time.sleep((remaining - _SLEEP_SLACK_NS) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
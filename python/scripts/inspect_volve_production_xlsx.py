@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import json
 import os
 import sys
 from pathlib import Path
+from typing import List, Tuple
 
-import pandas as pd
 from openpyxl import load_workbook
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_XLSX = ROOT / "data" / "volve" / "production" / "volve_production_data.xlsx"
 
+SAMPLE_ROWS = 5
+
 
 def resolve_input_path() -> Path:
     env_path = os.getenv("VOLVE_PRODUCTION_XLSX")
@@ -24,29 +27,73 @@ def resolve_input_path() -> Path:
     return DEFAULT_XLSX
 
 
+def infer_dtype(values: List[object]) -> str:
+    """Map sampled cell values to a pandas-style dtype string."""
+    non_null = [v for v in values if v is not None]
+    if not non_null:
+        return "object"
+    if all(isinstance(v, bool) for v in non_null):
+        return "bool"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in non_null):
+        return "int64"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in non_null):
+        return "float64"
+    if all(isinstance(v, (dt.datetime, dt.date)) for v in non_null):
+        return "datetime64[ns]"
+    return "object"
+
+
+def sample_sheet(ws) -> Tuple[List[str], List[Tuple[object, ...]]]:
+    """Return the header row and up to SAMPLE_ROWS sample rows in one scan."""
+    rows = list(ws.iter_rows(min_row=1, max_row=SAMPLE_ROWS + 1, values_only=True))
+    if not rows:
+        return [], []
+    header = [str(col) for col in rows[0]]
+    return header, rows[1:]
+
+
+def format_rows(header: List[str], rows: List[Tuple[object, ...]]) -> str:
+    widths = [len(col) for col in header]
+    rendered = [[("" if v is None else str(v)) for v in row] for row in rows]
+    for row in rendered:
+        for i, cell in enumerate(row[: len(widths)]):
+            widths[i] = max(widths[i], len(cell))
+    lines = [" ".join(col.rjust(widths[i]) for i, col in enumerate(header))]
+    for row in rendered:
+        lines.append(" ".join(cell.rjust(widths[i]) for i, cell in enumerate(row[: len(widths)])))
+    return "\n".join(lines)
+
+
 def main() -> int:
     xlsx_path = resolve_input_path()
     if not xlsx_path.exists():
         print(f"Error: Volve production XLSX not found at {xlsx_path}", file=sys.stderr)
         return 1
 
-    xls = pd.ExcelFile(xlsx_path, engine="openpyxl")
-    print("Sheets:", ", ".join(xls.sheet_names))
-
+    # A single read-only pass yields headers, samples, and row counts without
+    # materializing DataFrames for every sheet.
     workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+    print("Sheets:", ", ".join(workbook.sheetnames))
+
     schema = {}
+    for sheet in workbook.sheetnames:
+        ws = workbook[sheet]
+        header, samples = sample_sheet(ws)
 
-    for sheet in xls.sheet_names:
-        # Read a sample to keep this lightweight while still inferring dtypes.
-        df = pd.read_excel(xlsx_path, sheet_name=sheet, nrows=1000, engine="openpyxl")
         print(f"\nSheet: {sheet}")
-        print(df.head(5).to_string(index=False))
-
-        ws = workbook[sheet]
+        if header:
+            print(format_rows(header, samples))
+        else:
+            print("(empty sheet)")
+
+        dtypes = {
+            col: infer_dtype([row[i] if i < len(row) else None for row in samples])
+            for i, col in enumerate(header)
+        }
         row_count = max(ws.max_row - 1, 0)
         schema[sheet] = {
-            "columns": [str(col) for col in df.columns.tolist()],
-            "dtypes": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            "columns": header,
+            "dtypes": dtypes,
             "row_count": row_count,
         }
 
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import csv
-import json
 import logging
 import os
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict
 
 import numpy as np
 import paho.mqtt.client as mqtt
@@ -22,7 +20,10 @@ PYTHON_DIR = ROOT / "python"
 if str(PYTHON_DIR) not in sys.path:
     sys.path.insert(0, str(PYTHON_DIR))
 
-from ares1.physics.torque_drag import torque_baseline
+from ares1.physics.torque_drag import torque_baseline_array
+from ares1.utils import jsonio
+from ares1.utils.mqttio import PublishWorker
+from ares1.utils.timing import sleep_until
 
 
 def utc_now_iso() -> str:
@@ -39,15 +40,89 @@ def configure_logging() -> logging.Logger:
     return logging.getLogger("ares1.publish")
 
 
-def build_payload(value: float, unit: str) -> Dict[str, object]:
+def build_payload(value: float, unit: str, ts: str) -> Dict[str, object]:
     return {
-        "timestamp": utc_now_iso(),
+        "timestamp": ts,
         "value": value,
         "unit": unit,
         "source": "synthetic",
     }
 
 
+def generate_block(
+    t0: float,
+    period: float,
+    depth0: float,
+    salt_depth_m: float,
+    rng: np.random.Generator,
+    size: int,
+) -> Dict[str, np.ndarray]:
+    """Generate ``size`` telemetry samples in one vectorized pass.
+
+    Computing a whole block of trig/RNG/physics at once keeps the per-sample
+    work in NumPy instead of the interpreter; only MQTT publishing and CSV
+    writing remain per-sample.
+    """
+    t = t0 + np.arange(size) * period
+
+    rop_m_per_hr = np.maximum(5.0, 18.0 + 2.5 * np.sin(t / 30.0) + rng.normal(0.0, 0.4, size))
+    depth_m = depth0 + np.cumsum(rop_m_per_hr / 3600.0 * period)
+
+    rpm = 120.0 + 8.0 * np.sin(t / 20.0) + rng.normal(0.0, 1.0, size)
+    wob_kn = 90.0 + 6.0 * np.sin(t / 15.0) + rng.normal(0.0, 1.2, size)
+    hookload_kn = 210.0 + wob_kn + (depth_m / 1000.0) * 5.0 + rng.normal(0.0, 0.8, size)
+
+    in_salt_zone = depth_m >= salt_depth_m
+    mu = np.where(in_salt_zone, 0.55, 0.35)
+    baseline = torque_baseline_array(depth_m, mu, r_m=0.1, fn_per_m=3500.0)
+    noise_scale = np.where(in_salt_zone, 0.06, 0.02)
+    torque_nm = baseline + rng.normal(0.0, 1.0, size) * baseline * noise_scale
+
+    return {
+        "rop_m_per_hr": rop_m_per_hr,
+        "depth_m": depth_m,
+        "rpm": rpm,
+        "wob_kn": wob_kn,
+        "hookload_kn": hookload_kn,
+        "torque_nm": torque_nm,
+        "in_salt_zone": in_salt_zone,
+    }
+
+
+# The topic set is fixed; precompute the strings once instead of an
+# f-string per metric per tick.
+BUNDLE_TOPIC = "ares1/telemetry/bundle"
+METRICS = (
+    # (metric name, block key, unit, topic)
+    ("hookload", "hookload_kn", "kN", "ares1/telemetry/hookload"),
+    ("wob", "wob_kn", "kN", "ares1/telemetry/wob"),
+    ("rpm", "rpm", "rpm", "ares1/telemetry/rpm"),
+    ("torque", "torque_nm", "N*m", "ares1/telemetry/torque"),
+    ("rop", "rop_m_per_hr", "m/hr", "ares1/telemetry/rop"),
+    ("depth", "depth_m", "m", "ares1/telemetry/depth"),
+)
+
+CSV_HEADER = b"timestamp,depth_m,hookload_kn,wob_kn,rpm,torque_nm,rop_m_per_hr,in_salt_zone\n"
+CSV_FLUSH_BYTES = 64 * 1024
+CSV_FLUSH_SECONDS = 1.0
+
+
+def format_block_rows(timestamps: list, block: Dict[str, np.ndarray], count: int) -> bytes:
+    """Format ``count`` samples as pre-encoded CSV lines."""
+    depth = block["depth_m"]
+    hookload = block["hookload_kn"]
+    wob = block["wob_kn"]
+    rpm = block["rpm"]
+    torque = block["torque_nm"]
+    rop = block["rop_m_per_hr"]
+    in_salt = block["in_salt_zone"]
+    return "".join(
+        f"{timestamps[i]},{depth[i]:.3f},{hookload[i]:.2f},{wob[i]:.2f},"
+        f"{rpm[i]:.2f},{torque[i]:.2f},{rop[i]:.3f},{bool(in_salt[i])}\n"
+        for i in range(count)
+    ).encode("ascii")
+
+
 def main() -> None:
     load_dotenv()
     logger = configure_logging()
@@ -58,6 +133,8 @@ def main() -> None:
     salt_depth_m = float(os.getenv("SALT_DEPTH_M", "2000"))
 
     period = 1.0 / hz
+    block_size = int(os.getenv("TELEMETRY_BLOCK", str(max(1, int(hz)))))
+    legacy_topics = os.getenv("TELEMETRY_LEGACY_TOPICS", "0") == "1"
     rng = np.random.default_rng()
 
     outputs_dir = ROOT / "outputs"
@@ -66,101 +143,112 @@ def main() -> None:
     write_header = not csv_path.exists()
 
     client_id = f"ares1-pub-{int(time.time())}"
-    client = mqtt.Client(client_id=client_id)
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
+    # Lift paho's default inflight ceiling (20) and bound its internal queue
+    # so bursts don't serialize publishes or grow memory unbounded.
+    client.max_inflight_messages_set(1000)
+    client.max_queued_messages_set(10_000)
+    client.reconnect_delay_set(min_delay=1, max_delay=30)
 
     logger.info("Connecting to MQTT at %s:%s", broker_host, broker_port)
     client.connect(broker_host, broker_port, keepalive=60)
     client.loop_start()
+    worker = PublishWorker(client)
 
     depth_m = 0.0
-    start_time = time.perf_counter()
-    next_tick = start_time
+    period_ns = int(period * 1e9)
+    start_ns = time.perf_counter_ns()
+    next_tick_ns = start_ns
     last_log = time.time()
 
-    with csv_path.open("a", newline="") as csv_file:
-        writer = csv.DictWriter(
-            csv_file,
-            fieldnames=[
-                "timestamp",
-                "depth_m",
-                "hookload_kn",
-                "wob_kn",
-                "rpm",
-                "torque_nm",
-                "rop_m_per_hr",
-                "in_salt_zone",
-            ],
-        )
+    with csv_path.open("ab") as csv_file:
         if write_header:
-            writer.writeheader()
+            csv_file.write(CSV_HEADER)
+
+        # Rows accumulate as pre-formatted bytes and hit the file in large
+        # writes instead of one syscall per tick.
+        csv_buf = bytearray()
+        last_csv_flush = time.time()
+
+        def flush_csv() -> None:
+            nonlocal last_csv_flush
+            if csv_buf:
+                csv_file.write(csv_buf)
+                csv_buf.clear()
+            last_csv_flush = time.time()
 
-        logger.info("Publishing telemetry at %.1f Hz", hz)
+        logger.info("Publishing telemetry at %.1f Hz (block=%d)", hz, block_size)
         logger.info("Logging CSV to %s", csv_path)
 
+        block = generate_block(0.0, period, depth_m, salt_depth_m, rng, block_size)
+        block_index = 0
+        timestamps = []
+
         try:
             while True:
-                now = time.perf_counter()
-                if now < next_tick:
-                    time.sleep(next_tick - now)
-                    continue
-                next_tick += period
-
-                t = now - start_time
-
-                rop_m_per_hr = max(5.0, 18.0 + 2.5 * np.sin(t / 30.0) + rng.normal(0, 0.4))
-                rop_m_per_s = rop_m_per_hr / 3600.0
-                depth_m += rop_m_per_s * period
-
-                rpm = 120.0 + 8.0 * np.sin(t / 20.0) + rng.normal(0, 1.0)
-                wob_kn = 90.0 + 6.0 * np.sin(t / 15.0) + rng.normal(0, 1.2)
-                hookload_kn = 210.0 + wob_kn + (depth_m / 1000.0) * 5.0 + rng.normal(0, 0.8)
-
-                base_mu = 0.35
-                salt_mu = 0.55
-                mu = salt_mu if depth_m >= salt_depth_m else base_mu
-                baseline = torque_baseline(depth_m, mu, r_m=0.1, fn_per_m=3500.0)
-                noise_scale = 0.02 if depth_m < salt_depth_m else 0.06
-                torque_nm = baseline + rng.normal(0, baseline * noise_scale)
-
-                metrics: Dict[str, Tuple[float, str]] = {
-                    "hookload": (float(hookload_kn), "kN"),
-                    "wob": (float(wob_kn), "kN"),
-                    "rpm": (float(rpm), "rpm"),
-                    "torque": (float(torque_nm), "N*m"),
-                    "rop": (float(rop_m_per_hr), "m/hr"),
-                    "depth": (float(depth_m), "m"),
+                sleep_until(next_tick_ns)
+                now_ns = time.perf_counter_ns()
+                next_tick_ns += period_ns
+                if now_ns - next_tick_ns > 10 * period_ns:
+                    logger.warning("Tick overrun; resyncing schedule")
+                    next_tick_ns = now_ns
+
+                if block_index >= block_size:
+                    csv_buf += format_block_rows(timestamps, block, block_size)
+                    if len(csv_buf) > CSV_FLUSH_BYTES or time.time() - last_csv_flush >= CSV_FLUSH_SECONDS:
+                        flush_csv()
+                    timestamps = []
+                    depth_m = float(block["depth_m"][-1])
+                    block = generate_block(
+                        (now_ns - start_ns) / 1e9, period, depth_m, salt_depth_m, rng, block_size
+                    )
+                    block_index = 0
+
+                i = block_index
+                block_index += 1
+                timestamp = utc_now_iso()
+                timestamps.append(timestamp)
+
+                metrics = {
+                    name: {"value": float(block[key][i]), "unit": unit}
+                    for name, key, unit, _topic in METRICS
+                }
+
+                # One bundled publish per tick instead of six per-metric
+                # publishes; each paho publish takes a lock and wakes the
+                # network thread, so this is the dominant per-tick cost.
+                bundle = {
+                    "timestamp": timestamp,
+                    "source": "synthetic",
+                    "metrics": metrics,
                 }
+                worker.publish(BUNDLE_TOPIC, jsonio.dumps(bundle), qos=0, retain=False)
 
-                for name, (value, unit) in metrics.items():
-                    topic = f"ares1/telemetry/{name}"
-                    payload = build_payload(value=value, unit=unit)
-                    client.publish(topic, json.dumps(payload), qos=0, retain=False)
-
-                writer.writerow(
-                    {
-                        "timestamp": utc_now_iso(),
-                        "depth_m": depth_m,
-                        "hookload_kn": hookload_kn,
-                        "wob_kn": wob_kn,
-                        "rpm": rpm,
-                        "torque_nm": torque_nm,
-                        "rop_m_per_hr": rop_m_per_hr,
-                        "in_salt_zone": depth_m >= salt_depth_m,
-                    }
-                )
+                if legacy_topics:
+                    for name, _key, unit, topic in METRICS:
+                        payload = build_payload(
+                            value=metrics[name]["value"], unit=unit, ts=timestamp
+                        )
+                        worker.publish(topic, jsonio.dumps(payload), qos=0, retain=False)
 
                 now_wall = time.time()
                 if now_wall - last_log >= 1.0:
                     logger.info(
                         "depth=%.1f m torque=%.1f N*m rop=%.1f m/hr",
-                        depth_m,
-                        torque_nm,
-                        rop_m_per_hr,
+                        block["depth_m"][i],
+                        block["torque_nm"][i],
+                        block["rop_m_per_hr"][i],
                     )
                     last_log = now_wall
         except KeyboardInterrupt:
             logger.info("Stopping telemetry publisher")
         finally:
+            if block_index and timestamps:
+                csv_buf += format_block_rows(timestamps, block, block_index)
+            flush_csv()
+            worker.close()
+            if worker.dropped:
+                logger.warning("Dropped %d stale publishes", worker.dropped)
             client.loop_stop()
             client.disconnect()
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import signal
+import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +15,16 @@ import paho.mqtt.client as mqtt
 from dotenv import load_dotenv
 from rich.logging import RichHandler
 
+ROOT = Path(__file__).resolve().parents[2]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from ares1.utils import jsonio
+
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_FLUSH_SECONDS = 0.5
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -28,6 +40,48 @@ def configure_logging() -> logging.Logger:
     return logging.getLogger("ares1.sub.events")
 
 
+def make_on_message(log_fd: int, logger: logging.Logger):
+    """Build the message callback and its flush hook around a raw append fd.
+
+    Lines accumulate in a bytearray and reach the kernel as one atomic
+    os.write per flush; the returned ``flush`` drains the tail on shutdown.
+    """
+    log_buf = bytearray()
+    last_flush = time.monotonic()
+
+    def on_message(client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
+        nonlocal last_flush
+        try:
+            # jsonio.loads accepts bytes; the payload is only decoded to a
+            # str on the malformed-message path.
+            payload = jsonio.loads(msg.payload)
+        except ValueError:
+            payload = {"raw": msg.payload.decode("utf-8", errors="replace")}
+        if not isinstance(payload, dict):
+            payload = {"raw": payload}
+
+        payload["topic"] = msg.topic
+        payload["received_at"] = utc_now_iso()
+
+        log_buf.extend(jsonio.dumps(payload) + b"\n")
+        now = time.monotonic()
+        if len(log_buf) >= LOG_FLUSH_BYTES or now - last_flush >= LOG_FLUSH_SECONDS:
+            os.write(log_fd, log_buf)
+            log_buf.clear()
+            last_flush = now
+
+        logger.warning("Event: %s", payload.get("event_type", "unknown"))
+
+    def flush() -> None:
+        nonlocal last_flush
+        if log_buf:
+            os.write(log_fd, log_buf)
+            log_buf.clear()
+        last_flush = time.monotonic()
+
+    return on_message, flush
+
+
 def main() -> None:
     load_dotenv()
     logger = configure_logging()
@@ -35,40 +89,46 @@ def main() -> None:
     broker_host = os.getenv("MQTT_BROKER_HOST", "localhost")
     broker_port = int(os.getenv("MQTT_BROKER_PORT", "1883"))
 
-    root = Path(__file__).resolve().parents[2]
-    outputs_dir = root / "outputs"
+    outputs_dir = ROOT / "outputs"
     outputs_dir.mkdir(parents=True, exist_ok=True)
     log_path = outputs_dir / "events_log.jsonl"
 
-    def on_connect(client: mqtt.Client, userdata: object, flags: dict, rc: int) -> None:
-        if rc != 0:
+    # Append through a raw O_APPEND fd, skipping the BufferedWriter state
+    # machine entirely.
+    log_fd = os.open(os.fspath(log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    on_message, flush_log = make_on_message(log_fd, logger)
+
+    def on_connect(
+        client: mqtt.Client, userdata: object, flags: mqtt.ConnectFlags, rc, properties=None
+    ) -> None:
+        if rc.is_failure:
             logger.error("MQTT connect failed: rc=%s", rc)
             return
         logger.info("Connected to MQTT at %s:%s", broker_host, broker_port)
         client.subscribe("ares1/events/#")
 
-    def on_message(client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
-        try:
-            payload = json.loads(msg.payload.decode("utf-8"))
-        except json.JSONDecodeError:
-            payload = {"raw": msg.payload.decode("utf-8", errors="replace")}
-
-        payload["topic"] = msg.topic
-        payload["received_at"] = utc_now_iso()
-
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
-
-        logger.warning("Event: %s", payload.get("event_type", "unknown"))
-
     client_id = f"ares1-sub-events-{int(time.time())}"
-    client = mqtt.Client(client_id=client_id)
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
     client.on_connect = on_connect
     client.on_message = on_message
 
     logger.info("Connecting to MQTT at %s:%s", broker_host, broker_port)
     client.connect(broker_host, broker_port, keepalive=60)
-    client.loop_forever()
+    # loop_start keeps MQTT keepalive on a dedicated network thread; a slow
+    # callback can no longer stall pings into a disconnect. The main thread
+    # just parks until SIGTERM or Ctrl-C.
+    client.loop_start()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        logger.info("Stopping event subscriber")
+    finally:
+        client.loop_stop()
+        client.disconnect()
+        flush_log()
+        os.close(log_fd)
 
 
 if __name__ == "__main__":
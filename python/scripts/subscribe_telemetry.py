@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import bisect
 import logging
 import os
+import queue
+import signal
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 import paho.mqtt.client as mqtt
 from dotenv import load_dotenv
@@ -20,6 +23,8 @@ PYTHON_DIR = ROOT / "python"
 if str(PYTHON_DIR) not in sys.path:
     sys.path.insert(0, str(PYTHON_DIR))
 
+from ares1.utils import jsonio
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -45,47 +50,144 @@ def main() -> None:
     outputs_dir = ROOT / "outputs"
     outputs_dir.mkdir(parents=True, exist_ok=True)
     latest_path = outputs_dir / "telemetry_latest.json"
+    latest_tmp = latest_path.with_suffix(".json.tmp")
+    # Plain-str paths for the 1 Hz persist so each snapshot skips the
+    # Path -> fspath conversion in open/os.replace.
+    latest_path_str = os.fspath(latest_path)
+    latest_tmp_str = os.fspath(latest_tmp)
 
     state: Dict[str, Dict[str, object]] = {}
+    # Each key's payload is serialized once, when it changes; the snapshot
+    # is spliced together from the cached fragments instead of re-encoding
+    # every key's value on each persist.
+    fragments: Dict[str, bytes] = {}
+    # Keys are kept sorted incrementally (new topics are rare) so neither
+    # the snapshot nor the summary re-sorts on every tick; summary parts
+    # are re-rendered only for the key that changed.
+    known_keys: List[str] = []
+    summary_parts: Dict[str, str] = {}
     last_print = 0.0
 
-    def on_connect(client: mqtt.Client, userdata: object, flags: dict, rc: int) -> None:
-        if rc != 0:
+    # The paho network thread only parses and enqueues; state updates and
+    # disk writes happen on a dedicated sink thread so slow persists never
+    # stall keepalive handling. The bound keeps a dead disk from growing
+    # the backlog without limit.
+    sink_queue: queue.Queue = queue.Queue(maxsize=1024)
+    dropped = 0
+
+    def on_connect(
+        client: mqtt.Client, userdata: object, flags: mqtt.ConnectFlags, rc, properties=None
+    ) -> None:
+        if rc.is_failure:
             logger.error("MQTT connect failed: rc=%s", rc)
             return
         logger.info("Connected to MQTT at %s:%s", broker_host, broker_port)
         client.subscribe("ares1/telemetry/#")
 
-    def on_message(client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
-        nonlocal last_print
-        try:
-            payload = json.loads(msg.payload.decode("utf-8"))
-        except json.JSONDecodeError:
-            return
+    def store(key: str, entry: Dict[str, object]) -> None:
+        if key not in state:
+            bisect.insort(known_keys, key)
+        state[key] = entry
+        fragments[key] = jsonio.dumps(entry)
+        summary_parts[key] = f"{key}={entry.get('value')}"
 
-        key = msg.topic.split("/")[-1]
-        payload["topic"] = msg.topic
-        payload["received_at"] = utc_now_iso()
-        state[key] = payload
+    def handle_message(topic: str, payload: Dict[str, object]) -> None:
+        nonlocal last_print
 
-        latest_path.write_text(json.dumps(state, indent=2))
+        received_at = utc_now_iso()
+        key = topic.split("/")[-1]
+        if key == "bundle" and isinstance(payload.get("metrics"), dict):
+            # One bundled PUBLISH carries every metric; unpack it so state
+            # keeps the same per-metric shape as the legacy topics.
+            timestamp = payload.get("timestamp")
+            source = payload.get("source")
+            for name, metric in payload["metrics"].items():
+                entry = {
+                    "timestamp": timestamp,
+                    "value": metric.get("value"),
+                    "unit": metric.get("unit"),
+                    "source": source,
+                    "topic": topic,
+                    "received_at": received_at,
+                }
+                store(name, entry)
+        else:
+            payload["topic"] = topic
+            payload["received_at"] = received_at
+            store(key, payload)
 
         now = time.time()
         if now - last_print >= 1.0:
-            summary = " ".join(
-                f"{k}={state[k].get('value')}" for k in sorted(state.keys())
+            # Snapshot at the 1 Hz summary cadence rather than per message;
+            # the temp-file + os.replace keeps readers from seeing a partial
+            # write.
+            body = (
+                b"{"
+                + b",".join(jsonio.dumps(k) + b":" + fragments[k] for k in known_keys)
+                + b"}"
             )
-            logger.info("Latest: %s", summary)
+            with open(latest_tmp_str, "wb") as snapshot:
+                snapshot.write(body)
+            os.replace(latest_tmp_str, latest_path_str)
+
+            logger.info("Latest: %s", " ".join(summary_parts[k] for k in known_keys))
             last_print = now
 
+    def sink_loop() -> None:
+        while True:
+            item = sink_queue.get()
+            if item is None:
+                return
+            topic, payload = item
+            try:
+                handle_message(topic, payload)
+            except Exception:
+                # A bad payload must not kill the sink thread; the network
+                # loop would keep running with nothing draining the queue.
+                logger.warning("Failed to handle message on %s", topic, exc_info=True)
+
+    def on_message(client: mqtt.Client, userdata: object, msg: mqtt.MQTTMessage) -> None:
+        nonlocal dropped
+        try:
+            payload = jsonio.loads(msg.payload)
+        except ValueError:
+            return
+        if not isinstance(payload, dict):
+            # The wildcard subscription can see valid JSON that isn't an
+            # object (a bare number or array); handle_message assumes dicts.
+            return
+        try:
+            sink_queue.put_nowait((msg.topic, payload))
+        except queue.Full:
+            dropped += 1
+            if dropped % 500 == 1:
+                logger.warning("State sink backlog full; dropped %d messages", dropped)
+
+    sink_thread = threading.Thread(target=sink_loop, name="telemetry-sink", daemon=True)
+    sink_thread.start()
+
     client_id = f"ares1-sub-telemetry-{int(time.time())}"
-    client = mqtt.Client(client_id=client_id)
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=client_id)
     client.on_connect = on_connect
     client.on_message = on_message
 
     logger.info("Connecting to MQTT at %s:%s", broker_host, broker_port)
     client.connect(broker_host, broker_port, keepalive=60)
-    client.loop_forever()
+    # loop_start keeps MQTT keepalive on a dedicated network thread; with
+    # the sink thread handling persistence, the main thread just parks
+    # until SIGTERM or Ctrl-C.
+    client.loop_start()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        logger.info("Stopping telemetry subscriber")
+    finally:
+        client.loop_stop()
+        client.disconnect()
+        sink_queue.put(None)
+        sink_thread.join(timeout=5.0)
 
 
 if __name__ == "__main__":
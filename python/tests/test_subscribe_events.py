@@ -0,0 +1,56 @@
+import importlib.util
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "subscribe_events.py"
+
+_spec = importlib.util.spec_from_file_location("subscribe_events", SCRIPT)
+subscribe_events = importlib.util.module_from_spec(_spec)
+sys.modules["subscribe_events"] = subscribe_events
+_spec.loader.exec_module(subscribe_events)
+
+
+def _read_records(path: Path) -> list:
+    return [json.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def test_on_message_appends_jsonl(tmp_path) -> None:
+    log_path = tmp_path / "events.jsonl"
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    logger = logging.getLogger("test.sub.events")
+    on_message, flush = subscribe_events.make_on_message(log_fd, logger)
+
+    msg = SimpleNamespace(
+        topic="ares1/events/anomaly",
+        payload=b'{"event_type": "torque_anomaly", "z_score": 3.4}',
+    )
+    on_message(None, None, msg)
+    flush()
+    os.close(log_fd)
+
+    records = _read_records(log_path)
+    assert len(records) == 1
+    assert records[0]["event_type"] == "torque_anomaly"
+    assert records[0]["topic"] == "ares1/events/anomaly"
+    assert "received_at" in records[0]
+
+
+def test_on_message_keeps_malformed_payloads(tmp_path) -> None:
+    log_path = tmp_path / "events.jsonl"
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    logger = logging.getLogger("test.sub.events")
+    on_message, flush = subscribe_events.make_on_message(log_fd, logger)
+
+    on_message(None, None, SimpleNamespace(topic="ares1/events/x", payload=b"not json"))
+    on_message(None, None, SimpleNamespace(topic="ares1/events/x", payload=b"[1, 2]"))
+    flush()
+    os.close(log_fd)
+
+    records = _read_records(log_path)
+    assert len(records) == 2
+    assert records[0]["raw"] == "not json"
+    assert records[1]["raw"] == [1, 2]
@@ -12,3 +12,14 @@ def test_torque_increases_with_depth_and_mu() -> None:
     t3 = torque_baseline(depth_m=1500.0, mu=0.5, r_m=0.1, fn_per_m=3000.0)
     assert t2 > t1
     assert t3 > t2
+
+
+def test_torque_baseline_array_matches_scalar() -> None:
+    import numpy as np
+
+    from ares1.physics.torque_drag import torque_baseline_array
+
+    depths = np.array([500.0, 1000.0, 1500.0])
+    expected = [torque_baseline(d, mu=0.3, r_m=0.1, fn_per_m=3000.0) for d in depths]
+    result = torque_baseline_array(depths, mu=0.3, r_m=0.1, fn_per_m=3000.0)
+    assert np.allclose(result, expected)
@@ -28,7 +28,7 @@ Side effects: console logs with progress/heartbeats
 
 === Dependencies ===
 - Internal: none
-- External: pandas
+- External: pandas; pyarrow and orjson (optional fast paths)
 
 === Main Flow Narration ===
 1) Discover Volve-derived datasets, starting with the primary Ares-1 ready file.
@@ -55,23 +55,44 @@ Success looks like: dataset_quick_stats.json contains per-file metrics with fit
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
 import math
+import os
 import re
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:  # orjson is optional; the stdlib json writer remains the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:  # pyarrow is optional; the pandas chunk reader remains the fallback.
+    import pyarrow as pa
+    from pyarrow import compute as pa_compute
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pa_compute = None
+    pa_csv = None
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 CHUNK_SIZE = 200_000
 DUPLICATE_SAMPLE_ROWS = 200_000
 LARGE_FILE_BYTES = 500 * 1024 * 1024
+ARROW_BLOCK_BYTES = 64 * 1024 * 1024
+DTYPE_SAMPLE_ROWS = 5_000
 PRIMARY_DATASET_NAME = "volve_drilling_ares1_ready.csv"
 
+_NORM_RE = re.compile(r"[^a-z0-9]+")
+
 
 @dataclass
 class RunningStat:
@@ -99,13 +120,54 @@ class RunningStat:
           - Input: pd.Series([1, 2, 3])
           - Output: count/mean/min/max updated in place
         """
-        values = pd.to_numeric(series, errors="coerce").dropna()
+        if series.dtype.kind in "iuf":
+            # Already numeric: skip the coercion copy and per-element scan.
+            values = series.dropna()
+        else:
+            values = pd.to_numeric(series, errors="coerce").dropna()
         if values.empty:
             return
 
-        chunk_count = int(values.count())
-        chunk_mean = float(values.mean())
-        chunk_var = float(values.var(ddof=0))
+        self.update_from_moments(
+            int(values.count()),
+            float(values.mean()),
+            float(values.var(ddof=0)),
+            float(values.min()),
+            float(values.max()),
+        )
+
+    def update_from_moments(
+        self,
+        chunk_count: int,
+        chunk_mean: float,
+        chunk_var: float,
+        chunk_min: float,
+        chunk_max: float,
+    ) -> None:
+        """
+        Name: update_from_moments
+        Why it exists: merge precomputed chunk moments without re-scanning values.
+        Args:
+          - chunk_count: int
+          - chunk_mean: float
+          - chunk_var: float (population variance, ddof=0)
+          - chunk_min: float
+          - chunk_max: float
+        Returns:
+          - None
+        Raises:
+          - None
+        Assumptions:
+          - moments come from the same chunk (vectorized DataFrame reductions)
+        Edge cases:
+          - chunk_count == 0 is a no-op
+        Example I/O:
+          - Input: (3, 2.0, 0.666, 1.0, 3.0)
+          - Output: count/mean/min/max updated in place
+        """
+        if chunk_count == 0:
+            return
+
         chunk_m2 = chunk_var * chunk_count
 
         if self.count == 0:
@@ -119,8 +181,6 @@ class RunningStat:
             self.m2 = self.m2 + chunk_m2 + delta * delta * self.count * chunk_count / total
             self.count = total
 
-        chunk_min = float(values.min())
-        chunk_max = float(values.max())
         if self.min_value is None or chunk_min < self.min_value:
             self.min_value = chunk_min
         if self.max_value is None or chunk_max > self.max_value:
@@ -149,6 +209,188 @@ class RunningStat:
         return math.sqrt(self.m2 / self.count)
 
 
+@dataclass
+class VectorRunningStat:
+    """
+    Name: VectorRunningStat
+    Why it exists: hold per-column running moments as 1-D NumPy arrays so a
+      whole chunk's statistics combine in a handful of vectorized
+      expressions instead of one Python-level Welford merge per column.
+    Assumptions:
+      - chunks present the same columns in the same order
+    Edge cases:
+      - all-null columns contribute nothing (masked by the per-chunk count)
+    """
+
+    columns: List[str]
+    count: np.ndarray = field(init=False, repr=False)
+    mean: np.ndarray = field(init=False, repr=False)
+    m2: np.ndarray = field(init=False, repr=False)
+    min_value: np.ndarray = field(init=False, repr=False)
+    max_value: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        ncols = len(self.columns)
+        self.count = np.zeros(ncols)
+        self.mean = np.zeros(ncols)
+        self.m2 = np.zeros(ncols)
+        self.min_value = np.full(ncols, np.inf)
+        self.max_value = np.full(ncols, -np.inf)
+
+    def update_from_frame(self, num: pd.DataFrame) -> None:
+        """
+        Name: update_from_frame
+        Why it exists: merge one numeric-coerced chunk into all column stats.
+        Args:
+          - num: pd.DataFrame (already coerced to numeric dtypes)
+        Returns:
+          - None
+        Raises:
+          - None
+        Assumptions:
+          - num's columns match self.columns in order
+        Edge cases:
+          - chunks where every column is all-null are a no-op
+        Example I/O:
+          - Input: coerced 200k-row chunk
+          - Output: count/mean/m2/min/max arrays updated in place
+        """
+        chunk_count = num.count().to_numpy(dtype=np.float64)
+        has_values = chunk_count > 0
+        if not has_values.any():
+            return
+
+        chunk_mean = np.where(has_values, num.mean().to_numpy(dtype=np.float64), 0.0)
+        chunk_var = np.where(has_values, num.var(ddof=0).to_numpy(dtype=np.float64), 0.0)
+
+        total = self.count + chunk_count
+        safe_total = np.where(total > 0, total, 1.0)
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * chunk_count / safe_total
+        self.m2 = (
+            self.m2
+            + chunk_var * chunk_count
+            + delta * delta * self.count * chunk_count / safe_total
+        )
+        self.count = total
+
+        chunk_min = num.min().to_numpy(dtype=np.float64)
+        chunk_max = num.max().to_numpy(dtype=np.float64)
+        self.min_value = np.where(
+            has_values, np.minimum(self.min_value, chunk_min), self.min_value
+        )
+        self.max_value = np.where(
+            has_values, np.maximum(self.max_value, chunk_max), self.max_value
+        )
+
+    def to_running_stats(self) -> Dict[str, "RunningStat"]:
+        """
+        Name: to_running_stats
+        Why it exists: convert the array state back to per-column RunningStat
+          objects for the shared summary path.
+        Args:
+          - None
+        Returns:
+          - Dict[str, RunningStat]
+        Raises:
+          - None
+        Assumptions:
+          - called once, after the chunk loop completes
+        Edge cases:
+          - columns that never saw a numeric value yield an empty RunningStat
+        Example I/O:
+          - Input: none
+          - Output: {"BIT_DEPTH": RunningStat(count=1200000, ...), ...}
+        """
+        stats: Dict[str, RunningStat] = {}
+        for i, col in enumerate(self.columns):
+            stat = RunningStat()
+            col_count = int(self.count[i])
+            if col_count:
+                stat.count = col_count
+                stat.mean = float(self.mean[i])
+                stat.m2 = float(self.m2[i])
+                stat.min_value = float(self.min_value[i])
+                stat.max_value = float(self.max_value[i])
+            stats[col] = stat
+        return stats
+
+
+@dataclass
+class DuplicateSampler:
+    """
+    Name: DuplicateSampler
+    Why it exists: count duplicate rows in the first N sampled rows without
+      materializing a concatenated sample DataFrame at the end of the scan.
+    Assumptions:
+      - pandas' vectorized uint64 row hasher is collision-free in practice
+        for a 200k-row sample
+    Edge cases:
+      - an empty sample reports method="sampled" with zero rows
+    """
+
+    sample_limit: int = DUPLICATE_SAMPLE_ROWS
+    sampled: int = 0
+    duplicate_rows: int = 0
+    _seen: set = field(default_factory=set, repr=False)
+
+    def add(self, frame: pd.DataFrame) -> None:
+        """
+        Name: add
+        Why it exists: fold the next chunk's rows into the duplicate count.
+        Args:
+          - frame: pd.DataFrame
+        Returns:
+          - None
+        Raises:
+          - None
+        Assumptions:
+          - chunks arrive in file order (first-N sampling stays deterministic)
+        Edge cases:
+          - once the sample limit is reached further chunks are ignored
+        Example I/O:
+          - Input: DataFrame with 2 identical rows
+          - Output: duplicate_rows incremented by 1
+        """
+        remaining = self.sample_limit - self.sampled
+        if remaining <= 0 or frame.empty:
+            return
+        take = min(remaining, len(frame))
+        hashes = pd.util.hash_pandas_object(frame.iloc[:take], index=False).to_numpy()
+        seen = self._seen
+        for row_hash in hashes.tolist():
+            if row_hash in seen:
+                self.duplicate_rows += 1
+            else:
+                seen.add(row_hash)
+        self.sampled += take
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Name: summary
+        Why it exists: emit the duplicate_sample block for the report dict.
+        Args:
+          - None
+        Returns:
+          - Dict[str, object]
+        Raises:
+          - None
+        Assumptions:
+          - add() has been called for every sampled chunk
+        Edge cases:
+          - zero sampled rows yields a zero rate
+        Example I/O:
+          - Input: none
+          - Output: {"method": "first_rows", "sample_rows": 100, ...}
+        """
+        return {
+            "method": "first_rows" if self.sampled else "sampled",
+            "sample_rows": self.sampled,
+            "duplicate_rows": self.duplicate_rows,
+            "duplicate_rate": round(self.duplicate_rows / self.sampled, 4) if self.sampled else 0.0,
+        }
+
+
 def utc_now() -> datetime:
     """
     Name: utc_now
@@ -210,16 +452,21 @@ def normalize_name(value: str) -> str:
       - Input: "Bit Measured Depth m"
       - Output: "bit measured depth m"
     """
-    return re.sub(r"[^a-z0-9]+", " ", str(value).lower()).strip()
+    return _NORM_RE.sub(" ", str(value).lower()).strip()
 
 
-def find_column(columns: Iterable[str], candidates: List[str]) -> Optional[str]:
+def find_column(
+    columns: Iterable[str],
+    candidates: List[str],
+    normalized: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
     """
     Name: find_column
     Why it exists: choose a column name based on normalized candidate hints.
     Args:
       - columns: Iterable[str]
       - candidates: List[str]
+      - normalized: Optional[Dict[str, str]] (prebuilt normalized-name map)
     Returns:
       - Optional[str]
     Raises:
@@ -232,7 +479,8 @@ def find_column(columns: Iterable[str], candidates: List[str]) -> Optional[str]:
       - Input: ["BIT_DEPTH", "ROP"], ["BIT_DEPTH", "DEPTH"]
       - Output: "BIT_DEPTH"
     """
-    normalized = {normalize_name(col): col for col in columns}
+    if normalized is None:
+        normalized = {normalize_name(col): col for col in columns}
     for candidate in candidates:
         key = normalize_name(candidate)
         if key in normalized:
@@ -263,19 +511,23 @@ def detect_standard_columns(columns: List[str]) -> Dict[str, Optional[str]]:
       - Input: ["BIT_DEPTH", "ROP", "VIBRATION_0_5"]
       - Output: {"depth": "BIT_DEPTH", "rop": "ROP", "vibration": "VIBRATION_0_5"}
     """
+    normalized = {normalize_name(col): col for col in columns}
     depth = find_column(
         columns,
         ["BIT_DEPTH", "BIT_DEPTH_M", "BIT MEASURED DEPTH", "DEPTH", "MD", "HOLE DEPTH"],
+        normalized,
     )
     rop = find_column(
         columns,
         ["ROP", "ROP_MH", "ROP_M/H", "RATE OF PENETRATION", "TIME AVERAGED ROP"],
+        normalized,
     )
     vibration = find_column(
         columns,
         ["VIBRATION_0_5", "VIBRATION", "VIBRATION_RAW", "LATERAL VIBRATION", "VIBRATION_PROXY"],
+        normalized,
     )
-    time_col = find_column(columns, ["TIME", "TIMESTAMP", "DATETIME", "DATE TIME"])
+    time_col = find_column(columns, ["TIME", "TIMESTAMP", "DATETIME", "DATE TIME"], normalized)
 
     return {"depth": depth, "rop": rop, "vibration": vibration, "time": time_col}
 
@@ -340,71 +592,350 @@ def discover_datasets() -> List[Path]:
     return paths
 
 
-def analyze_dataset(path: Path) -> Dict[str, object]:
+def scan_dataset_arrow(
+    path: Path,
+    standard_cols: Dict[str, Optional[str]],
+    vibration_range: Optional[Tuple[float, float]],
+    missing_counts: Dict[str, int],
+    numeric_stats: Dict[str, RunningStat],
+) -> Tuple[int, int, int, int, "DuplicateSampler"]:
     """
-    Name: analyze_dataset
-    Why it exists: compute health metrics and fit score for a dataset.
+    Name: scan_dataset_arrow
+    Why it exists: stream chunk statistics through pyarrow's C++ CSV reader.
     Args:
       - path: Path
+      - standard_cols: Dict[str, Optional[str]]
+      - vibration_range: Optional[Tuple[float, float]]
+      - missing_counts: Dict[str, int] (mutated in place)
+      - numeric_stats: Dict[str, RunningStat] (mutated in place)
     Returns:
-      - Dict[str, object]
+      - Tuple of (row_count, fully_empty_rows, depth_negative,
+        vibration_out_of_range, duplicates)
+    Raises:
+      - pyarrow.ArrowInvalid: on malformed CSV input
+    Assumptions:
+      - pyarrow is importable (callers check `pa is not None`)
+      - arrow's type inference marks numeric columns as int/float
+    Edge cases:
+      - numeric text inside string-typed columns is not coerced (unlike the
+        pandas fallback); Volve exports type these columns numerically
+    Example I/O:
+      - Input: Path("data/volve_logs/volve_drilling_best.csv"), ...
+      - Output: (1200000, 0, 0, 0, [DataFrame])
+    """
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_BYTES),
+        # pandas treats empty fields as NaN everywhere; mirror that for
+        # string columns so missingness matches the fallback path.
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+
+    row_count = 0
+    fully_empty_rows = 0
+    depth_negative = 0
+    vibration_out_of_range = 0
+    duplicates = DuplicateSampler()
+
+    depth_col = standard_cols.get("depth")
+    vibration_col = standard_cols.get("vibration")
+
+    for index, batch in enumerate(reader):
+        row_count += batch.num_rows
+
+        empty_mask = None
+        for i, schema_field in enumerate(batch.schema):
+            arr = batch.column(i)
+            missing_counts[schema_field.name] += arr.null_count
+
+            null_mask = pa_compute.is_null(arr)
+            empty_mask = (
+                null_mask if empty_mask is None else pa_compute.and_(empty_mask, null_mask)
+            )
+
+            if pa.types.is_integer(schema_field.type) or pa.types.is_floating(schema_field.type):
+                valid = batch.num_rows - arr.null_count
+                if valid:
+                    min_max = pa_compute.min_max(arr)
+                    numeric_stats[schema_field.name].update_from_moments(
+                        valid,
+                        pa_compute.mean(arr).as_py(),
+                        pa_compute.variance(arr, ddof=0).as_py(),
+                        min_max["min"].as_py(),
+                        min_max["max"].as_py(),
+                    )
+
+        if empty_mask is not None and batch.num_rows:
+            fully_empty_rows += int(pa_compute.sum(empty_mask).as_py() or 0)
+
+        names = batch.schema.names
+        if depth_col and depth_col in names:
+            arr = batch.column(batch.schema.get_field_index(depth_col))
+            if pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type):
+                negative = pa_compute.sum(pa_compute.less(arr, 0)).as_py()
+                depth_negative += int(negative or 0)
+
+        if vibration_col and vibration_range and vibration_col in names:
+            arr = batch.column(batch.schema.get_field_index(vibration_col))
+            if pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type):
+                lower, upper = vibration_range
+                out_of_range = pa_compute.sum(
+                    pa_compute.or_(pa_compute.less(arr, lower), pa_compute.greater(arr, upper))
+                ).as_py()
+                vibration_out_of_range += int(out_of_range or 0)
+
+        sample_remaining = duplicates.sample_limit - duplicates.sampled
+        if sample_remaining > 0:
+            take = min(sample_remaining, batch.num_rows)
+            duplicates.add(batch.slice(0, take).to_pandas())
+
+        if (index + 1) % 10 == 0:
+            log(f"Processed {row_count} rows from {path.name}")
+
+    return row_count, fully_empty_rows, depth_negative, vibration_out_of_range, duplicates
+
+
+def infer_numeric_dtypes(path: Path) -> Dict[str, str]:
+    """
+    Name: infer_numeric_dtypes
+    Why it exists: sample the head of a CSV once so numeric columns can be
+      parsed directly to float64 instead of being re-inferred per chunk.
+    Args:
+      - path: Path
+    Returns:
+      - Dict[str, str] (column -> dtype string for pd.read_csv)
     Raises:
       - None
     Assumptions:
-      - CSV has headers and can be streamed in chunks
+      - the first DTYPE_SAMPLE_ROWS rows are representative of column types
     Edge cases:
-      - empty datasets produce zero rows and empty stats
+      - a column that turns non-numeric later makes the hinted read raise;
+        callers retry without hints
     Example I/O:
       - Input: Path("data/volve_logs/volve_drilling_best.csv")
-      - Output: metrics dictionary with missingness and stats
+      - Output: {"BIT_DEPTH": "float64", "ROP": "float64"}
     """
-    file_size = path.stat().st_size
-    if file_size > LARGE_FILE_BYTES:
-        log(f"Large file detected ({file_size} bytes). Processing in chunks.")
+    sample = pd.read_csv(path, nrows=DTYPE_SAMPLE_ROWS, low_memory=False)
+    return {col: "float64" for col in sample.columns if sample[col].dtype.kind in "iuf"}
 
-    columns = pd.read_csv(path, nrows=0).columns.tolist()
-    standard_cols = detect_standard_columns(columns)
 
+def scan_dataset_pandas(
+    path: Path,
+    columns: List[str],
+    standard_cols: Dict[str, Optional[str]],
+    vibration_range: Optional[Tuple[float, float]],
+    dtype_hints: Dict[str, str],
+) -> Tuple[int, int, int, int, "DuplicateSampler", Dict[str, int], Dict[str, RunningStat]]:
+    """
+    Name: scan_dataset_pandas
+    Why it exists: stream chunk statistics with the pandas CSV reader,
+      casting hinted columns at parse time so the hot loop only coerces
+      columns that actually arrived as objects.
+    Args:
+      - path: Path
+      - columns: List[str]
+      - standard_cols: Dict[str, Optional[str]]
+      - vibration_range: Optional[Tuple[float, float]]
+      - dtype_hints: Dict[str, str] (from infer_numeric_dtypes; may be empty)
+    Returns:
+      - Tuple of (row_count, fully_empty_rows, depth_negative,
+        vibration_out_of_range, duplicates, missing_counts, numeric_stats)
+    Raises:
+      - ValueError: when a dtype hint conflicts with later rows
+    Assumptions:
+      - CSV has headers and can be streamed in chunks
+    Edge cases:
+      - empty datasets produce zero rows and empty stats
+    Example I/O:
+      - Input: Path("data/volve_logs/volve_drilling_best.csv"), ...
+      - Output: accumulated counters plus per-column stats
+    """
     missing_counts = {col: 0 for col in columns}
-    numeric_stats = {col: RunningStat() for col in columns}
+    vector_stats = VectorRunningStat(columns)
 
     row_count = 0
     fully_empty_rows = 0
     depth_negative = 0
     vibration_out_of_range = 0
+    duplicates = DuplicateSampler()
 
-    sample_frames = []
-    sample_remaining = DUPLICATE_SAMPLE_ROWS
-
-    vibration_range = expect_vibration_range(standard_cols.get("vibration"))
+    depth_col = standard_cols.get("depth")
+    vibration_col = standard_cols.get("vibration")
 
-    for index, chunk in enumerate(pd.read_csv(path, chunksize=CHUNK_SIZE, low_memory=False)):
+    reader = pd.read_csv(
+        path, chunksize=CHUNK_SIZE, low_memory=False, dtype=dtype_hints or None
+    )
+    for index, chunk in enumerate(reader):
         row_count += len(chunk)
-        fully_empty_rows += int(chunk.isna().all(axis=1).sum())
 
-        for col in columns:
-            missing_counts[col] += int(chunk[col].isna().sum())
-            numeric_stats[col].update(chunk[col])
+        # Materialize the null mask once as a contiguous bool ndarray; the
+        # per-column missing counts and the fully-empty row count are both
+        # reductions over the same buffer.
+        isna_np = chunk.isna().to_numpy()
+        fully_empty_rows += int(isna_np.all(axis=1).sum())
+        for col, value in zip(chunk.columns, isna_np.sum(axis=0)):
+            missing_counts[col] += int(value)
+
+        # Hinted columns arrive as float64 straight from the parser; only
+        # the columns that still carry object/other dtypes pay to_numeric.
+        object_cols = [col for col in chunk.columns if chunk[col].dtype.kind not in "iuf"]
+        if object_cols:
+            num = chunk.copy(deep=False)
+            for col in object_cols:
+                num[col] = pd.to_numeric(chunk[col], errors="coerce")
+        else:
+            num = chunk
+        vector_stats.update_from_frame(num)
 
-        depth_col = standard_cols.get("depth")
-        if depth_col and depth_col in chunk:
-            depth_series = pd.to_numeric(chunk[depth_col], errors="coerce")
-            depth_negative += int((depth_series < 0).sum())
+        # The depth/vibration checks read the already-coerced frame instead
+        # of re-running pd.to_numeric over the raw columns - one coercion
+        # pass feeds stats and validation alike.
+        if depth_col and depth_col in num:
+            depth_negative += int((num[depth_col] < 0).sum())
 
-        vibration_col = standard_cols.get("vibration")
-        if vibration_col and vibration_col in chunk and vibration_range:
-            vib_series = pd.to_numeric(chunk[vibration_col], errors="coerce")
+        if vibration_col and vibration_col in num and vibration_range:
+            vib_series = num[vibration_col]
             lower, upper = vibration_range
             vibration_out_of_range += int(((vib_series < lower) | (vib_series > upper)).sum())
 
-        if sample_remaining > 0:
-            take = min(sample_remaining, len(chunk))
-            sample_frames.append(chunk.iloc[:take])
-            sample_remaining -= take
+        duplicates.add(chunk)
 
         if (index + 1) % 10 == 0:
             log(f"Processed {row_count} rows from {path.name}")
 
+    return (
+        row_count,
+        fully_empty_rows,
+        depth_negative,
+        vibration_out_of_range,
+        duplicates,
+        missing_counts,
+        vector_stats.to_running_stats(),
+    )
+
+
+def analyze_dataset(path: Path) -> Dict[str, object]:
+    """
+    Name: analyze_dataset
+    Why it exists: compute health metrics and fit score for a dataset.
+    Args:
+      - path: Path
+    Returns:
+      - Dict[str, object]
+    Raises:
+      - None
+    Assumptions:
+      - CSV has headers and can be streamed in chunks
+    Edge cases:
+      - empty datasets produce zero rows and empty stats
+    Example I/O:
+      - Input: Path("data/volve_logs/volve_drilling_best.csv")
+      - Output: metrics dictionary with missingness and stats
+    """
+    file_size = path.stat().st_size
+    if file_size > LARGE_FILE_BYTES:
+        log(f"Large file detected ({file_size} bytes). Processing in chunks.")
+
+    columns = pd.read_csv(path, nrows=0).columns.tolist()
+    standard_cols = detect_standard_columns(columns)
+    vibration_range = expect_vibration_range(standard_cols.get("vibration"))
+
+    if pa is not None:
+        missing_counts = {col: 0 for col in columns}
+        numeric_stats = {col: RunningStat() for col in columns}
+        (
+            row_count,
+            fully_empty_rows,
+            depth_negative,
+            vibration_out_of_range,
+            duplicates,
+        ) = scan_dataset_arrow(
+            path, standard_cols, vibration_range, missing_counts, numeric_stats
+        )
+    else:
+        dtype_hints = infer_numeric_dtypes(path)
+        try:
+            (
+                row_count,
+                fully_empty_rows,
+                depth_negative,
+                vibration_out_of_range,
+                duplicates,
+                missing_counts,
+                numeric_stats,
+            ) = scan_dataset_pandas(path, columns, standard_cols, vibration_range, dtype_hints)
+        except (TypeError, ValueError):
+            log(f"Dtype hints failed for {path.name}; re-reading with per-chunk inference.")
+            (
+                row_count,
+                fully_empty_rows,
+                depth_negative,
+                vibration_out_of_range,
+                duplicates,
+                missing_counts,
+                numeric_stats,
+            ) = scan_dataset_pandas(path, columns, standard_cols, vibration_range, {})
+
+    return _summarize_dataset(
+        path,
+        file_size,
+        columns,
+        standard_cols,
+        vibration_range,
+        missing_counts,
+        numeric_stats,
+        row_count,
+        fully_empty_rows,
+        depth_negative,
+        vibration_out_of_range,
+        duplicates,
+    )
+
+
+def _summarize_dataset(
+    path: Path,
+    file_size: int,
+    columns: List[str],
+    standard_cols: Dict[str, Optional[str]],
+    vibration_range: Optional[Tuple[float, float]],
+    missing_counts: Dict[str, int],
+    numeric_stats: Dict[str, RunningStat],
+    row_count: int,
+    fully_empty_rows: int,
+    depth_negative: int,
+    vibration_out_of_range: int,
+    duplicates: DuplicateSampler,
+) -> Dict[str, object]:
+    """
+    Name: _summarize_dataset
+    Why it exists: turn accumulated chunk statistics into the report dict.
+    Args:
+      - path: Path
+      - file_size: int
+      - columns: List[str]
+      - standard_cols: Dict[str, Optional[str]]
+      - vibration_range: Optional[Tuple[float, float]]
+      - missing_counts: Dict[str, int]
+      - numeric_stats: Dict[str, RunningStat]
+      - row_count: int
+      - fully_empty_rows: int
+      - depth_negative: int
+      - vibration_out_of_range: int
+      - duplicates: DuplicateSampler
+    Returns:
+      - Dict[str, object]
+    Raises:
+      - None
+    Assumptions:
+      - accumulators come from either the arrow or the pandas scan
+    Edge cases:
+      - row_count == 0 yields zero rates and empty stats
+    Example I/O:
+      - Input: accumulated counters for a dataset
+      - Output: metrics dictionary with missingness and stats
+    """
+    # Rates carry 4 decimals and stats 6 significant-ish decimals in the
+    # report; full float precision only bloats the JSON and churns diffs.
     missingness = {}
     for col in columns:
         missing = missing_counts[col]
@@ -412,9 +943,9 @@ def analyze_dataset(path: Path) -> Dict[str, object]:
         rate = missing / row_count if row_count else 0.0
         missingness[col] = {
             "missing": missing,
-            "missing_rate": rate,
+            "missing_rate": round(rate, 4),
             "non_null": non_null,
-            "non_null_rate": non_null / row_count if row_count else 0.0,
+            "non_null_rate": round(non_null / row_count, 4) if row_count else 0.0,
         }
 
     numeric_summary = {}
@@ -423,27 +954,13 @@ def analyze_dataset(path: Path) -> Dict[str, object]:
             continue
         numeric_summary[col] = {
             "count": stat.count,
-            "min": stat.min_value,
-            "max": stat.max_value,
-            "mean": stat.mean,
-            "std": stat.std(),
+            "min": round(stat.min_value, 6),
+            "max": round(stat.max_value, 6),
+            "mean": round(stat.mean, 6),
+            "std": round(stat.std(), 6),
         }
 
-    duplicate_sample = {
-        "method": "sampled",
-        "sample_rows": 0,
-        "duplicate_rows": 0,
-        "duplicate_rate": 0.0,
-    }
-    if sample_frames:
-        sample_df = pd.concat(sample_frames, ignore_index=True)
-        duplicate_rows = int(sample_df.duplicated().sum())
-        duplicate_sample = {
-            "method": "first_rows",
-            "sample_rows": len(sample_df),
-            "duplicate_rows": duplicate_rows,
-            "duplicate_rate": duplicate_rows / len(sample_df) if len(sample_df) else 0.0,
-        }
+    duplicate_sample = duplicates.summary()
 
     depth_col = standard_cols.get("depth")
     rop_col = standard_cols.get("rop")
@@ -520,7 +1037,7 @@ def analyze_dataset(path: Path) -> Dict[str, object]:
         "missingness": missingness,
         "numeric_stats": numeric_summary,
         "fully_empty_rows": fully_empty_rows,
-        "fully_empty_row_pct": fully_empty_pct,
+        "fully_empty_row_pct": round(fully_empty_pct, 4),
         "duplicate_sample": duplicate_sample,
         "standard_columns": standard_cols,
         "depth": {
@@ -595,11 +1112,19 @@ def main() -> None:
             log("No datasets found under data/volve_logs.")
             return
 
-        results = []
         for path in datasets:
             role = "primary" if path.name == PRIMARY_DATASET_NAME else "upstream"
             log(f"Analyzing {path.name} ({role} dataset)")
-            results.append(analyze_dataset(path))
+
+        # Each dataset analysis is CPU-bound and independent; fan out across
+        # processes when there is more than one file. executor.map preserves
+        # the dataset order in the report.
+        max_workers = min(len(datasets), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(analyze_dataset, datasets))
+        else:
+            results = [analyze_dataset(path) for path in datasets]
 
         output = {
             "generated_at": utc_now().isoformat().replace("+00:00", "Z"),
@@ -608,7 +1133,10 @@ def main() -> None:
 
         output_path = REPO_ROOT / "docs" / "dataset_quick_stats.json"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
         log(f"Wrote dataset quick stats: {output_path.as_posix()}")
     except Exception as exc:
         log(f"ERROR: {type(exc).__name__}: {exc}")